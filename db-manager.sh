@@ -87,7 +87,8 @@ function backup_database() {
             ;;
     esac
 
-    cp "$DB_FILE" "$BACKUP_FILE" 2>/tmp/error.log
+    # Use SQLite's online backup so rows still in the -wal file are included
+    sqlite3 "$DB_FILE" ".backup '$BACKUP_FILE'" 2>/tmp/error.log
     if [ $? -eq 0 ]; then
         echo "Successfully backed up the database to $BACKUP_FILE."
     else
@@ -133,7 +134,8 @@ function restore_database() {
         return
     fi
 
-    cp "$BACKUP_FILE" "$DB_FILE" 2>/tmp/error.log
+    # Restore through SQLite rather than copying over the file, which is unsafe while WatchRARr has it open in WAL mode
+    sqlite3 "$DB_FILE" ".restore '$BACKUP_FILE'" 2>/tmp/error.log
     if [ $? -eq 0 ]; then
         echo "Successfully restored the database from $BACKUP_FILE."
     else
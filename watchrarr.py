@@ -33,23 +33,97 @@ Configuration Options (config.yaml):
 __version__ = '1.2.6-develop'
 
 import argparse
+import hashlib
+import itertools
 import logging
+import multiprocessing
 import os
 import sqlite3
 import sys
+import queue
+import signal
+import threading
 import yaml
 import rarfile
 import shutil
 import time
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from time import sleep
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from logging import _nameToLevel as log_levels_dict
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# Number of scanned files to accumulate before committing them to the database
+SCAN_COMMIT_BATCH = 1000
+
+# Matches RAR archives and their split volumes (.rar, .r00-.r99, .000-.099)
+_RAR_RE = re.compile(r'(?i)\.(?:rar|r\d{2}|0\d{2})$')
+
+# Matches the volume number of new-style split archives (.part01.rar)
+_PART_RE = re.compile(r'(?i)\.part(\d+)\.rar$')
+
+# Matches the volume number of numbered split archives (.000, .001)
+_NUMBERED_RE = re.compile(r'\.(\d{3})$')
+
+# Chunk size used when streaming archive entries to disk
+EXTRACT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Suffix for extracted files until they are complete
+TMP_SUFFIX = b'.tmp'
+
+# Write buffer size for extracted files
+EXTRACT_WRITE_BUFFER = 4 * 1024 * 1024  # 4 MiB
+
+# Maximum number of archive entries extracted concurrently across all extraction worker processes
+EXTRACT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Number of worker processes extracting watched archives at once
+EXTRACT_PROCESSES = max(1, EXTRACT_MAX_WORKERS // 2)
+
+# Entries extracted concurrently within one archive, sized so all workers together stay within EXTRACT_MAX_WORKERS
+EXTRACT_THREADS = max(1, EXTRACT_MAX_WORKERS // EXTRACT_PROCESSES)
+
+# Maximum number of new archives waiting for their transfer to complete at once
+WAIT_MAX_WORKERS = 16
+
+# Seconds without new events for an archive before its files are handed off for extraction
+DEBOUNCE_SECONDS = 2
+
+# Longest a transfer wait goes without checking whether shutdown was requested
+STOP_CHECK_SECONDS = 1
+
+# Seconds a transfer wait keeps watching after the last open volume is closed, for the next volume to appear
+NEXT_VOLUME_GRACE_SECONDS = 2
+
+# Per-thread SQLite connections; the watchdog observer and the scanner run on different threads
+_db_local = threading.local()
+
+# Serializes watcher inserts with reloads of the processed files cache
+_processed_lock = threading.Lock()
+
+# Extraction workers are spawned, not forked, since the observer and other threads are running by then;
+# everything shared with them (the log queue) has to come from this same context
+_mp_context = multiprocessing.get_context('spawn')
+
 def main(args):
+    # Stop promptly on SIGTERM (e.g. docker stop), including during the startup scan
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    # Skip collecting record attributes the log format never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Configure logging
     log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     log_handler = RotatingFileHandler(args.log_file, mode='a', maxBytes=args.max_log_size * 1024 * 1024,
@@ -63,51 +137,164 @@ def main(args):
     logger.addHandler(log_handler)
     logger.setLevel(getattr(logging, args.logging_level.upper()))
 
+    # Extraction worker processes log through this queue so only this process writes to the log file
+    log_queue = _mp_context.Queue()
+    log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+    log_listener.start()
+
     logging.info(f"WatchRARr v{__version__} successfully started")
     logging.info("Configuration file loaded successfully.")
 
     # Initialize the SQLite database
-    conn = sqlite3.connect(args.db_file)
+    conn = get_db(args.db_file)
     create_processed_files_table(conn)
+    # Cache of processed files, (re)loaded from the database at the start of every manual scan
+    processed = {}
+
+    # Files being extracted right now, shared so the scanner and the watcher never extract the same archive
+    in_progress = InProgressFiles()
 
     # Initial scan of the directory
-    manual_scan(args, conn)
+    manual_scan(args, conn, processed, in_progress, stop_event)
 
     # Set up a Watchdog observer to monitor the directory
-    event_handler = RarEventHandler(args)
+    event_handler = RarEventHandler(args, processed, in_progress, log_queue)
     observer = Observer()
     observer.schedule(event_handler, args.watch_directory, recursive=True)
     observer.start()
 
     try:
-        while True:
-            sleep(args.scan_interval)
-            manual_scan(args, conn)
+        while observer.is_alive() and not stop_event.wait(args.scan_interval):
+            manual_scan(args, conn, processed, in_progress, stop_event)
     except KeyboardInterrupt:
-        observer.stop()
+        pass
+    observer.stop()
     observer.join()
+    event_handler.shutdown()
+    log_listener.stop()
 
 def is_rar_archive(file):
     """Check if the given file is a RAR archive, including split archives."""
-    if file.lower().endswith('.rar'):
-        return True
-    elif file.lower()[-4:-3] == '.' and file.lower()[-3:].isdigit() and int(file.lower()[-3:]) < 100:
-        return True
-    return False
+    return _RAR_RE.search(file) is not None
+
+def is_first_volume(file, siblings=None):
+    """Check if the given RAR file is a single archive or the first volume of a split archive.
+
+    Only the first volume can be extracted; .rNN volumes and .partN.rar with N > 1 continue it. A numbered
+    .NNN volume is the first one when it has the lowest number and there is no <name>.rar to start the set.
+    siblings are the names of the other files in its directory, listed when not given."""
+    name = os.path.basename(file)
+    if name.lower().endswith('.rar'):
+        match = _PART_RE.search(name)
+        return match is None or int(match.group(1)) == 1
+
+    match = _NUMBERED_RE.search(name)
+    if match is None:
+        return False
+    if siblings is None:
+        siblings = os.listdir(os.path.dirname(file))
+
+    stem = name[:-len(match.group(0))].lower()
+    numbers = [int(match.group(1))]
+    for sibling in siblings:
+        sibling_lower = sibling.lower()
+        if sibling_lower == stem + '.rar':
+            return False
+        sibling_match = _NUMBERED_RE.search(sibling)
+        if sibling_match and sibling_lower[:-len(sibling_match.group(0))] == stem:
+            numbers.append(int(sibling_match.group(1)))
+    return int(match.group(1)) == min(numbers)
+
+def archive_base_name(file_name):
+    """Return the name shared by all volumes of an archive, e.g. 'movie' for 'movie.part01.rar'."""
+    base_name, _ = os.path.splitext(file_name)
+    return re.sub(r'\.part\d+', '', base_name)
 
 def get_related_rar_files(file_path):
+    """Return every volume in the same directory that belongs to file_path's archive (.rar, .rNN, .NNN)."""
     directory, file_name = os.path.split(file_path)
-    base_name, _ = os.path.splitext(file_name)
-    base_name = re.sub(r'\.part\d+', '', base_name)
+    base_name = archive_base_name(file_name)
     related_files = []
 
+    # Always listed fresh; a volume created moments ago must not be missed by the transfer wait
     for entry in os.listdir(directory):
-        if entry.startswith(base_name) and entry.endswith(".rar"):
+        if is_rar_archive(entry) and archive_base_name(entry) == base_name:
             related_files.append(os.path.join(directory, entry))
 
     return related_files
 
-def wait_for_transfer_completion(file_path):
+def wait_for_close_write(paths, timeout, stop_event=None):
+    """Wait until every path has been closed after writing, or none has been written to for timeout seconds.
+
+    A file that is already complete never reports a close, so a path whose mtime is at least timeout
+    seconds old when the watches are set up counts as complete straight away, and the quiet period of a
+    recently written path is measured from its mtime.
+    Volumes of the same archives that appear during the wait are waited on too, and once the last one is
+    closed the wait lingers for NEXT_VOLUME_GRACE_SECONDS in case the uploader is about to start another.
+    Returns True if every volume was seen closed or found complete, False if the wait ended on the quiet
+    timeout or because stop_event was set."""
+    pending = {os.path.abspath(p) for p in paths}
+    archives = {(os.path.dirname(p), archive_base_name(os.path.basename(p))) for p in pending}
+
+    with INotify() as inotify:
+        watch_dirs = {}
+        for directory in {os.path.dirname(p) for p in pending}:
+            wd = inotify.add_watch(directory, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO | inotify_flags.MODIFY)
+            watch_dirs[wd] = directory
+
+        # Stat after the watches are in place so no later write can go unnoticed
+        now = time.time()
+        deadline = time.monotonic()
+        for path in list(pending):
+            try:
+                idle = now - os.stat(path).st_mtime
+            except OSError:
+                pending.discard(path)
+                continue
+            if idle >= timeout:
+                pending.discard(path)
+            else:
+                deadline = max(deadline, time.monotonic() + min(timeout, timeout - idle))
+
+        closed_at = None  # when the last pending volume was closed
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            if pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+            else:
+                if closed_at is None:
+                    return True
+                remaining = closed_at + NEXT_VOLUME_GRACE_SECONDS - time.monotonic()
+                if remaining <= 0:
+                    return True
+            for event in inotify.read(timeout=int(min(remaining, STOP_CHECK_SECONDS) * 1000)):
+                if event.mask & inotify_flags.Q_OVERFLOW:
+                    # Events were dropped, so there may have been writes we never saw
+                    deadline = time.monotonic() + timeout
+                    continue
+                if event.wd not in watch_dirs:
+                    continue
+                directory = watch_dirs[event.wd]
+                if not is_rar_archive(event.name) or (directory, archive_base_name(event.name)) not in archives:
+                    continue
+                path = os.path.join(directory, event.name)
+                # Any write activity on a volume of the archive, including one created since the wait
+                # started, restarts the quiet period
+                deadline = time.monotonic() + timeout
+                if event.mask & (inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO):
+                    pending.discard(path)
+                    if not pending:
+                        closed_at = time.monotonic()
+                else:
+                    pending.add(path)
+
+def wait_for_transfer_completion(file_path, stop_event=None):
+    """Wait until file_path and its related volumes are no longer being written.
+
+    Returns False if stop_event was set before the transfer completed, True otherwise."""
     check_interval = 5
     stable_duration = 10
     stable_start_time = None
@@ -117,6 +304,21 @@ def wait_for_transfer_completion(file_path):
 
     logging.info(f"Waiting for transfer completion of {file_path} and related files...")
 
+    if INotify is not None and sys.platform.startswith('linux'):
+        # Let the kernel report when the uploader closes each file instead of polling sizes
+        try:
+            if wait_for_close_write(related_files, stable_duration, stop_event):
+                logging.debug(f"All files related to {file_path} are complete.")
+            elif stop_event is not None and stop_event.is_set():
+                logging.info(f"Stopped waiting for {file_path} for shutdown.")
+                return False
+            else:
+                logging.debug(f"No writes to files related to {file_path} for {stable_duration} seconds.")
+            return True
+        except OSError as e:
+            # e.g. ENOSPC/EMFILE once the watchdog observer has used up the inotify watch or instance limits
+            logging.warning(f"Failed to watch {file_path} with inotify, falling back to polling: {str(e)}")
+
     while True:
         all_files_stable = True
 
@@ -133,73 +335,219 @@ def wait_for_transfer_completion(file_path):
             if stable_start_time is None:
                 stable_start_time = time.time()
             elif time.time() - stable_start_time >= stable_duration:
-                break
+                return True
+
+        if stop_event is None:
+            time.sleep(check_interval)
+        elif stop_event.wait(check_interval):
+            logging.info(f"Stopped waiting for {file_path} for shutdown.")
+            return False
 
-        time.sleep(check_interval)
+def process_rar_file(filepath, args, conn, processed, stop_event=None):
+    """Process a RAR file by extracting its contents and storing its path in the SQLite database.
 
-def process_rar_file(filepath, args):
-    """Process a RAR file by extracting its contents and storing its path in the SQLite database."""
+    Returns False if stop_event was set while waiting for the transfer, leaving the file unprocessed."""
 
     # Wait for the file transfer to complete before processing
-    wait_for_transfer_completion(filepath)
-    
-    # Connect to the SQLite database
-    conn = sqlite3.connect(args.db_file)
-    cursor = conn.cursor()
+    if not wait_for_transfer_completion(filepath, stop_event):
+        return False
 
     # Check if the file has been processed before
-    cursor.execute('SELECT mtime FROM processed_files WHERE filepath = ?', (filepath,))
-    result = cursor.fetchone()
-
-    if result is None:
+    if filepath not in processed:
         # Extract the RAR archive and store its path in the database
         logging.info(f"Extracting {filepath}")
         extract_rar(filepath)
+        record_processed_file(filepath, conn, processed)
+    else:
+        logging.debug(f"File {filepath} has already been processed.")
+    return True
+
+class InProgressFiles:
+    """Thread-safe set of RAR files currently being extracted."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files = set()
+
+    def claim(self, filepath):
+        """Mark filepath as in progress; returns False if it already was."""
+        with self._lock:
+            if filepath in self._files:
+                return False
+            self._files.add(filepath)
+            return True
+
+    def release(self, filepath):
+        with self._lock:
+            self._files.discard(filepath)
+
+def _init_worker_logging(log_queue, level):
+    """Send a worker process's log records to the main process instead of the inherited file handler."""
+    logger = logging.getLogger()
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.setLevel(level)
+
+def record_processed_file(filepath, conn, processed):
+    """Store a freshly extracted RAR file's path and mtime in the cache and the SQLite database."""
+    file_mtime = os.path.getmtime(filepath)
+    # Held until the row is committed so a concurrent refresh can't drop the new cache entry
+    with _processed_lock:
+        # The volume signature is filled in by the next manual scan
+        processed[filepath] = (file_mtime, None)
         try:
-            cursor.execute('INSERT INTO processed_files (filepath, mtime) VALUES (?, ?)', (filepath, os.path.getmtime(filepath)))
+            conn.execute('INSERT INTO processed_files (filepath, mtime) VALUES (?, ?)', (filepath, file_mtime))
             conn.commit()
         except sqlite3.IntegrityError:
             logging.warning(f"File path {filepath} already exists in the database. Skipping insertion.")
-    else:
-        logging.debug(f"File {filepath} has already been processed.")
 
-    conn.close()
+def open_db(db_file):
+    """Open the SQLite database with WAL journaling and relaxed syncing for append-mostly writes."""
+    # Autocommit mode so batches control their own transactions; keep parsed statements cached
+    conn = sqlite3.connect(db_file, isolation_level=None, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # 20 MB
+    return conn
+
+def get_db(db_file):
+    """Return the calling thread's SQLite connection, opening it on first use."""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = _db_local.conn = open_db(db_file)
+    return conn
 
 def create_processed_files_table(conn):
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS processed_files (
             filepath TEXT PRIMARY KEY,
-            mtime REAL
+            mtime REAL,
+            volumes_sig TEXT
         )
     """)
+    # Databases created before volumes_sig was introduced need the column added
+    columns = [row[1] for row in cursor.execute("PRAGMA table_info(processed_files)")]
+    if 'volumes_sig' not in columns:
+        cursor.execute("ALTER TABLE processed_files ADD COLUMN volumes_sig TEXT")
     conn.commit()
     logging.info("Processed_files table initialized in the SQLite database.")
 
-def manual_scan(args, conn):
-    """Perform a manual scan of the watch_directory to process existing RAR files."""
+def load_processed_files(conn):
+    """Load all processed file paths into a dict of (mtime, volumes_sig) used as a lookup cache."""
+    cursor = conn.execute("SELECT filepath, mtime, volumes_sig FROM processed_files")
+    processed = {filepath: (mtime, volumes_sig) for filepath, mtime, volumes_sig in cursor}
+    logging.info(f"Loaded {len(processed)} processed files from the SQLite database.")
+    return processed
+
+def refresh_processed_files(conn, processed):
+    """Reload the processed files cache in place, picking up entries added or removed with db-manager.sh."""
+    with _processed_lock:
+        fresh = load_processed_files(conn)
+        for filepath in processed.keys() - fresh.keys():
+            processed.pop(filepath, None)
+        processed.update(fresh)
+
+def iter_rar_files(root):
+    """Recursively yield os.DirEntry objects for RAR archives under root, reusing each entry's cached stat."""
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif is_rar_archive(entry.name):
+                        yield entry
+        except OSError as e:
+            logging.warning(f"Failed to scan directory {dirpath}: {str(e)}")
+
+def volumes_signature(entries):
+    """Return a short digest over the names, sizes and mtimes of an archive's volumes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, size, mtime_ns in sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in entries):
+        digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+def manual_scan(args, conn, processed, in_progress, stop_event=None):
+    """Perform a manual scan of the watch_directory to process existing RAR files.
+
+    The scan stops between archives once stop_event is set."""
     logging.info("Starting manual directory scan...")
-    
-    cursor = conn.cursor()
 
-    for dirpath, dirnames, filenames in os.walk(args.watch_directory):
-        for file in filenames:
-            if file.lower().endswith('.rar'):
-                filepath = os.path.join(dirpath, file)
-                file_mtime = os.path.getmtime(filepath)
-                
-                cursor.execute("SELECT mtime FROM processed_files WHERE filepath=?", (filepath,))
-                result = cursor.fetchone()
-                
-                if result is None or file_mtime > result[0]:
-                    process_rar_file(filepath, args)
-                    cursor.execute("INSERT OR REPLACE INTO processed_files (filepath, mtime) VALUES (?, ?)", (filepath, file_mtime))
-                    conn.commit()
-                else:
-                    logging.debug(f"File {filepath} has already been processed.")
+    refresh_processed_files(conn, processed)
+    pending = []
 
+    # iter_rar_files yields all archives of a directory together, so volumes can be grouped per directory
+    for _, dir_entries in itertools.groupby(iter_rar_files(args.watch_directory), key=lambda e: os.path.dirname(e.path)):
+        archives = {}
+        for entry in dir_entries:
+            archives.setdefault(archive_base_name(entry.name), []).append(entry)
+
+        for volumes in archives.values():
+            if stop_event is not None and stop_event.is_set():
+                break
+            volumes_sig = volumes_signature(volumes)
+            volume_names = [v.name for v in volumes]
+
+            for entry in volumes:
+                filepath = entry.path
+                file_mtime = entry.stat().st_mtime
+
+                result = processed.get(filepath)
+
+                # Fast path: none of the archive's volumes changed since it was recorded
+                if result is not None and result[1] == volumes_sig:
+                    logging.debug(f"File {filepath} has already been processed.")
+                    continue
+
+                if result is not None and file_mtime <= result[0]:
+                    # Another volume of the set changed; this one is unchanged and already processed
+                    logging.debug(f"File {filepath} has already been processed. Recording its volume signature.")
+                elif not is_first_volume(entry.path, volume_names):
+                    # Continuation volumes are extracted through their first volume, so they are only recorded
+                    logging.debug(f"Recording {filepath} as a continuation volume.")
+                elif not in_progress.claim(filepath):
+                    # The watcher is extracting it and records it when done
+                    logging.debug(f"File {filepath} is already being processed.")
+                    continue
+                else:
+                    try:
+                        # Left unrecorded when shutdown interrupts the wait, so the next startup retries it
+                        if not process_rar_file(filepath, args, conn, processed, stop_event):
+                            continue
+                    finally:
+                        in_progress.release(filepath)
+
+                processed[filepath] = (file_mtime, volumes_sig)
+                pending.append((filepath, file_mtime, volumes_sig))
+                if len(pending) >= SCAN_COMMIT_BATCH:
+                    record_processed_files(conn, pending)
+                    pending = []
+
+        if stop_event is not None and stop_event.is_set():
+            logging.info("Stopping manual directory scan early for shutdown.")
+            break
+
+    record_processed_files(conn, pending)
     logging.info("Finished manual directory scan.")
 
+def record_processed_files(conn, rows):
+    """Write a batch of (filepath, mtime, volumes_sig) rows to the database in a single transaction."""
+    if not rows:
+        return
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("INSERT OR REPLACE INTO processed_files (filepath, mtime, volumes_sig) VALUES (?, ?, ?)", rows)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        logging.error(f"Failed to record {len(rows)} processed files: {str(e)}")
+        raise
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Watch a directory for new RAR archives and extract them.")
@@ -215,35 +563,48 @@ def parse_args():
     return parser.parse_args()
 
 
+def _extract_one(rf, rar_info, target_dir):
+    """Extract a single archive entry into target_dir (a bytes path) and return its uncompressed size."""
+    # Bytes paths are handed to the OS without re-encoding on every call
+    final_file_path = os.path.join(target_dir, os.fsencode(rar_info.filename))
+    # Write under a .tmp name so other programs never pick up a partial file
+    tmp_file_path = final_file_path + TMP_SUFFIX
+    log_entries = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if log_entries:
+        logging.debug("Extracting %s to %s", rar_info.filename, os.fsdecode(tmp_file_path))
+    with rf.open(rar_info) as rar_file, open(tmp_file_path, 'wb', buffering=EXTRACT_WRITE_BUFFER) as tmp_file:
+        # Stream data in 1 MiB chunks
+        shutil.copyfileobj(rar_file, tmp_file, length=EXTRACT_CHUNK_SIZE)
+        if hasattr(os, 'posix_fadvise'):
+            # Extracted files are not read back, so keep them from crowding out the page cache
+            tmp_file.flush()
+            try:
+                os.posix_fadvise(tmp_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                # Only a hint; some filesystems don't support it
+                pass
+
+    if log_entries:
+        logging.debug("Renaming %s to %s", os.fsdecode(tmp_file_path), os.fsdecode(final_file_path))
+    os.replace(tmp_file_path, final_file_path)
+
+    return rar_info.file_size
+
 def extract_rar(filepath):
-    """Extract a RAR file and rename extracted files to remove .tmp extension."""
+    """Extract a RAR file, renaming each extracted file to remove its .tmp extension as soon as it is complete."""
     try:
         with rarfile.RarFile(filepath) as rf:
             target_dir = os.path.dirname(filepath)
+            target_dir_bytes = os.fsencode(target_dir)
 
-            logging.info(f"Number of files in the archive: {len(rf.infolist())}")
+            infos = rf.infolist()
+            logging.info(f"Number of files in the archive: {len(infos)}")
 
             start_time = time.time()
-            extracted_files_size = 0
-
-            # Extract files with a .tmp extension
-            for rar_info in rf.infolist():
-                tmp_file_path = os.path.join(target_dir, rar_info.filename + '.tmp')
-                logging.info(f"Extracting {rar_info.filename} to {tmp_file_path}")
-                extracted_files_size += rar_info.file_size
-                with open(tmp_file_path, 'wb') as tmp_file:
-                    with rf.open(rar_info) as rar_file:
-                        # Read and wrdddddddddddddddite data in chunks
-                        chunk_size = 1024 * 1024  # 1 MiB
-                        while (chunk := rar_file.read(chunk_size)):
-                            tmp_file.write(chunk)
-
-            # Rename files to remove .tmp extension
-            for rar_info in rf.infolist():
-                tmp_file_path = os.path.join(target_dir, rar_info.filename + '.tmp')
-                final_file_path = os.path.join(target_dir, rar_info.filename)
-                logging.info(f"Renaming {tmp_file_path} to {final_file_path}")
-                shutil.move(tmp_file_path, final_file_path)
+
+            # Each rf.open() returns an independent reader, so entries can be extracted concurrently
+            with ThreadPoolExecutor(max_workers=EXTRACT_THREADS) as executor:
+                extracted_files_size = sum(executor.map(lambda rar_info: _extract_one(rf, rar_info, target_dir_bytes), infos))
 
             elapsed_time = time.time() - start_time
             extracted_files_size_mb = extracted_files_size / (1024 * 1024)
@@ -253,8 +614,22 @@ def extract_rar(filepath):
         logging.error(f"Failed to extract {filepath}: {str(e)}")
 
 class RarEventHandler(FileSystemEventHandler):
-    def __init__(self, args):
+    def __init__(self, args, processed, in_progress, log_queue):
         self.args = args
+        self.processed = processed
+        self.in_progress = in_progress
+        self.log_queue = log_queue
+        # Transfers are waited on in threads here, so worker processes only ever do extraction
+        self.waiters = ThreadPoolExecutor(max_workers=WAIT_MAX_WORKERS)
+        # Archives are extracted in worker processes so a burst of uploads is handled in parallel
+        # and the observer thread is never blocked
+        self.pool_lock = threading.Lock()
+        self.pool = self._new_pool()
+        self.stopping = threading.Event()
+        # Events are queued and coalesced per archive by a single dispatcher thread
+        self.queue = queue.Queue()
+        self.dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self.dispatcher.start()
 
     def on_created(self, event):
         """Handle RAR file creation events."""
@@ -263,7 +638,127 @@ class RarEventHandler(FileSystemEventHandler):
             logging.info(f"File created: {file}")
             if is_rar_archive(file):
                 logging.info(f"New RAR file detected: {file}")
-                process_rar_file(file, self.args)
+                self.queue.put((time.monotonic(), file))
+
+    def _dispatch(self):
+        """Submit queued RAR files once their archive has gone DEBOUNCE_SECONDS without new events."""
+        pending = {}  # (directory, archive base name) -> (time of last event, files)
+        while True:
+            now = time.monotonic()
+            timeout = None
+            if pending:
+                timeout = max(0, min(last for last, _ in pending.values()) + DEBOUNCE_SECONDS - now)
+
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                # Shutting down; files still being debounced are found again by the startup scan
+                if pending:
+                    logging.info(f"Dropping {len(pending)} archives still waiting to be extracted; they will be picked up at the next startup.")
+                return
+
+            if item:
+                event_time, file = item
+                directory, file_name = os.path.split(file)
+                key = (directory, archive_base_name(file_name))
+                files = pending[key][1] if key in pending else set()
+                files.add(file)
+                pending[key] = (event_time, files)
+
+            now = time.monotonic()
+            for key, (last, files) in list(pending.items()):
+                if now - last >= DEBOUNCE_SECONDS:
+                    del pending[key]
+                    self._submit_all(files)
+
+    def _submit_all(self, files):
+        """Submit each file, logging failures so one bad file can't stop the dispatcher thread."""
+        for file in sorted(files):
+            try:
+                self.submit(file)
+            except Exception as e:
+                logging.error(f"Failed to submit {file} for extraction: {str(e)}")
+
+    def submit(self, filepath):
+        """Wait for a RAR file's transfer and extract it unless it is already processed or in progress."""
+        if filepath in self.processed:
+            logging.debug(f"File {filepath} has already been processed.")
+            return
+        if not is_first_volume(filepath):
+            # Continuation volumes are extracted through their first volume, so they are only recorded
+            logging.debug(f"Recording {filepath} as a continuation volume.")
+            record_processed_file(filepath, get_db(self.args.db_file), self.processed)
+            return
+        if not self.in_progress.claim(filepath):
+            logging.debug(f"File {filepath} is already being processed.")
+            return
+        try:
+            self.waiters.submit(self._wait_and_extract, filepath)
+        except Exception:
+            self.in_progress.release(filepath)
+            raise
+
+    def _wait_and_extract(self, filepath):
+        """Wait for the transfer to complete, then hand the RAR file to the process pool."""
+        try:
+            wait_for_transfer_completion(filepath, self.stopping)
+            if self.stopping.is_set():
+                self.in_progress.release(filepath)
+                return
+            # A manual scan may have finished this file before it was claimed here
+            if filepath in self.processed:
+                logging.debug(f"File {filepath} has already been processed.")
+                self.in_progress.release(filepath)
+                return
+            logging.info(f"Extracting {filepath}")
+            future = self._submit_extraction(filepath)
+        except Exception as e:
+            logging.error(f"Failed to process {filepath}: {str(e)}")
+            self.in_progress.release(filepath)
+            return
+        future.add_done_callback(lambda f: self._on_extracted(filepath, f))
+
+    def _submit_extraction(self, filepath):
+        with self.pool_lock:
+            try:
+                return self.pool.submit(extract_rar, filepath)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM killed), which leaves the whole pool unusable
+                logging.warning("Extraction process pool is broken, restarting it.")
+                self.pool.shutdown(wait=False)
+                self.pool = self._new_pool()
+                return self.pool.submit(extract_rar, filepath)
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=EXTRACT_PROCESSES, mp_context=_mp_context,
+                                   initializer=_init_worker_logging,
+                                   initargs=(self.log_queue, logging.getLogger().level))
+
+    def _on_extracted(self, filepath, future):
+        """Record a RAR file once its worker process has finished with it."""
+        try:
+            # Cancelled by shutdown(); the file is picked up again at the next startup
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                logging.error(f"Failed to process {filepath}: {str(error)}")
+                return
+            record_processed_file(filepath, get_db(self.args.db_file), self.processed)
+        finally:
+            self.in_progress.release(filepath)
+
+    def shutdown(self):
+        """Drop work that hasn't started, wait for running extractions to finish and stop the worker processes."""
+        self.stopping.set()
+        self.queue.put(None)
+        self.dispatcher.join()
+        self.waiters.shutdown(wait=True, cancel_futures=True)
+        with self.pool_lock:
+            self.pool.shutdown(wait=True, cancel_futures=True)
 
     def on_modified(self, event):
         if not event.is_directory: